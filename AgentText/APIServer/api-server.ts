@@ -277,7 +277,8 @@ const activeConnections = new Set<Response>()
  * {
  *   "webhook": {
  *     "url": "https://your-server.com/webhook",
- *     "headers": { "Authorization": "Bearer token" }
+ *     "headers": { "Authorization": "Bearer token" },
+ *     "fullMessage": true   // optional: POST the full message, as on /watcher/stream
  *   }
  * }
  */
@@ -287,6 +288,9 @@ app.post('/watcher/start', async (req: Request, res: Response) => {
             return res.status(400).json({ error: 'Watcher already running' })
         }
 
+        // Optional per-watcher webhook; the watcher POSTs each new message to it
+        const webhook = req.body?.webhook?.url ? req.body.webhook : undefined
+
         await sdk.startWatching({
             onMessage: async (message: Message) => {
                 console.log(`[Watcher] New message from ${message.sender}: ${message.text}`)
@@ -308,10 +312,10 @@ app.post('/watcher/start', async (req: Request, res: Response) => {
                     conn.write(`data: ${data}\n\n`)
                 })
             }
-        })
+        }, webhook)
 
         watcherActive = true
-        res.json({ status: 'Watcher started', timestamp: new Date().toISOString() })
+        res.json({ status: 'Watcher started', webhook: webhook?.url ?? null, timestamp: new Date().toISOString() })
     } catch (error) {
         console.error('Error starting watcher:', error)
         res.status(500).json({
@@ -24,7 +24,7 @@
 
 import { type Plugin, PluginManager } from '../plugins/core'
 import { type Recipient, asRecipient } from '../types/advanced'
-import type { IMessageConfig, ResolvedConfig } from '../types/config'
+import type { IMessageConfig, ResolvedConfig, WebhookConfig } from '../types/config'
 import type {
     ChatSummary,
     ListChatsOptions,
@@ -500,8 +500,11 @@ export class IMessageSDK {
 
     /**
      * Start watching for new messages
+     *
+     * @param events Watcher event callbacks
+     * @param webhook Webhook for this watcher, overriding the one from the SDK config
      */
-    async startWatching(events?: WatcherEvents): Promise<void> {
+    async startWatching(events?: WatcherEvents, webhook?: WebhookConfig): Promise<void> {
         if (this.destroyed) throw new Error(ERROR_SDK_DESTROYED)
         if (this.watcher) throw new Error(ERROR_WATCHER_RUNNING)
 
@@ -510,7 +513,7 @@ export class IMessageSDK {
             this.config.watcher.pollInterval,
             this.config.watcher.unreadOnly,
             this.config.watcher.excludeOwnMessages,
-            this.config.webhook,
+            webhook ?? this.config.webhook,
             events,
             this.pluginManager,
             this.config.debug,
@@ -279,7 +279,7 @@ export class MessageSender {
     }
 
     /**
-     * Prepare all attachments (download, convert)
+     * Prepare all attachments (download, convert) concurrently
      */
     private async prepareAttachments(attachments: readonly string[]): Promise<string[]> {
         if (attachments.length === 0) {
@@ -290,22 +290,18 @@ export class MessageSender {
             console.log(`[Processing Attachments] Total ${attachments.length} attachments`)
         }
 
-        const resolvedPaths: string[] = []
+        // Promise.all preserves input order, so attachments are sent as given
+        return Promise.all(
+            attachments.map((attachment, i) => {
+                if (this.debug) {
+                    const attachmentPreview = attachment.length > 80 ? `${attachment.slice(0, 80)}...` : attachment
 
-        for (let i = 0; i < attachments.length; i++) {
-            const attachment = attachments[i]!
-
-            if (this.debug) {
-                const attachmentPreview = attachment.length > 80 ? `${attachment.slice(0, 80)}...` : attachment
-
-                console.log(`[Processing Attachments] ${i + 1}/${attachments.length}: ${attachmentPreview}`)
-            }
-
-            const resolved = await this.resolveAttachment(attachment)
-            resolvedPaths.push(resolved)
-        }
+                    console.log(`[Processing Attachments] ${i + 1}/${attachments.length}: ${attachmentPreview}`)
+                }
 
-        return resolvedPaths
+                return this.resolveAttachment(attachment)
+            })
+        )
     }
 
     /**
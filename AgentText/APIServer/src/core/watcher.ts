@@ -224,7 +224,7 @@ export class MessageWatcher {
                     },
                     body: JSON.stringify({
                         event: 'new_message',
-                        message: {
+                        message: this.webhookConfig.fullMessage ? message : {
                             id: message.id,
                             text: message.text,
                             sender: message.sender,
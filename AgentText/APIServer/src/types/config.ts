@@ -32,6 +32,12 @@ export interface WebhookConfig {
      * Example: 500 means wait 500ms before the next retry
      */
     readonly backoffMs?: number
+
+    /**
+     * POST the full message object, as sent to watcher callbacks and the
+     * SSE stream, instead of the default summary (default: false)
+     */
+    readonly fullMessage?: boolean
 }
 
 // ==================== Watcher configuration ====================
@@ -5,6 +5,7 @@
  */
 
 import { exec } from 'node:child_process'
+import { randomUUID } from 'node:crypto'
 import { existsSync, writeFileSync } from 'node:fs'
 import { homedir } from 'node:os'
 import { join } from 'node:path'
@@ -15,6 +16,9 @@ import { delay } from './common'
 const execAsync = promisify(exec)
 const TEMP_DIR = join(homedir(), 'Pictures')
 
+/** Unique temp file name; attachments are resolved concurrently, so a timestamp alone can collide */
+const tempFileName = (suffix: string): string => `imsg_temp_${randomUUID()}${suffix}`
+
 interface DownloadOptions {
     timeout?: number // Default: 15000ms
     maxRetries?: number // Default: 2
@@ -24,7 +28,7 @@ interface DownloadOptions {
 
 /** Convert image to JPEG using macOS sips command */
 const convertImageToJPEG = async (inputPath: string, outputPath?: string): Promise<string> => {
-    const output = outputPath || join(TEMP_DIR, `imsg_temp_${Date.now()}.jpg`)
+    const output = outputPath || join(TEMP_DIR, tempFileName('.jpg'))
 
     try {
         const cmd = `sips -s format jpeg "${inputPath}" --out "${output}"`
@@ -83,7 +87,7 @@ export const downloadImage = async (url: string, options: DownloadOptions = {}):
             // Handle AVIF/WebP - convert to JPEG
             if (contentType.includes('avif') || contentType.includes('webp')) {
                 const ext = contentType.includes('avif') ? '.avif' : '.webp'
-                const tempPath = join(TEMP_DIR, `imsg_temp_${Date.now()}${ext}`)
+                const tempPath = join(TEMP_DIR, tempFileName(ext))
                 writeFileSync(tempPath, buffer)
 
                 const converted = await convertImageToJPEG(tempPath)
@@ -102,7 +106,7 @@ export const downloadImage = async (url: string, options: DownloadOptions = {}):
             }
             const ext = Object.entries(extMap).find(([key]) => contentType.includes(key))?.[1] || '.jpg'
 
-            const path = join(TEMP_DIR, `imsg_temp_${Date.now()}${ext}`)
+            const path = join(TEMP_DIR, tempFileName(ext))
             writeFileSync(path, buffer)
             return path
         } catch (error) {
@@ -141,7 +145,7 @@ export const convertToCompatibleFormat = async (filePath: string): Promise<{ pat
         .pop()!
         .replace(/\.(avif|webp)$/i, '.jpg')
     const isOurTemp = fileName.startsWith('imsg_temp_')
-    const output = isOurTemp ? join(TEMP_DIR, fileName) : join(TEMP_DIR, `imsg_temp_${Date.now()}_${fileName}`)
+    const output = isOurTemp ? join(TEMP_DIR, fileName) : join(TEMP_DIR, tempFileName(`_${fileName}`))
 
     const converted = await convertImageToJPEG(filePath, output)
     return { path: converted, converted: true }
@@ -0,0 +1,77 @@
+"""
+Minimal client for agent_daemon.py
+
+Only the standard library (and orjson, when installed) is imported here so a
+script can hand its arguments to a running daemon before loading argparse,
+requests or the agenttext package.
+"""
+
+import os
+import sys
+import socket
+
+from _reply import ERR, dumps, loads
+
+SOCKET_PATH = os.environ.get('AGENTTEXT_SOCKET', '/tmp/agenttext.sock')
+
+# Sent by the daemon for a request it will not run, so the script can run it
+# locally instead
+DECLINED = b'{"declined": true}\n'
+
+# A little above the daemon's 30 s HTTP timeout, so a stalled daemon cannot
+# hang a script for longer than running it directly would
+TIMEOUT = 35
+
+
+def request(script, argv):
+    """Send one request to the daemon; returns the raw reply line, or None if no daemon handled it
+
+    Once the request has been written the daemon may already have acted on
+    it, so from then on every failure is reported as an error reply rather
+    than None; only an explicit DECLINED lets the script run it locally.
+    """
+    # The default socket lives in world-writable /tmp, so only talk to one we own
+    try:
+        if os.stat(SOCKET_PATH).st_uid != os.getuid():
+            return None
+    except OSError:
+        return None
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(TIMEOUT)
+        try:
+            sock.connect(SOCKET_PATH)
+            sock.sendall(dumps({"script": script, "argv": argv}) + b'\n')
+        except OSError:
+            return None
+
+        try:
+            with sock.makefile('rb') as reader:
+                line = reader.readline()
+        except socket.timeout:
+            return ERR % dumps(f"No reply from agent_daemon.py on {SOCKET_PATH} within {TIMEOUT} seconds")
+        except OSError as e:
+            return ERR % dumps(f"Lost connection to agent_daemon.py: {e}")
+
+    if not line:
+        return ERR % dumps("agent_daemon.py closed the connection before replying")
+    return None if line == DECLINED else line
+
+
+def forward(script, argv):
+    """Run a script invocation in the daemon; returns its reply, or None if no daemon handled it"""
+    line = request(script, argv)
+    return loads(line) if line else None
+
+
+def run(script, argv):
+    """Print the daemon's reply and exit; returns only if no daemon handled the call"""
+    if '-h' in argv or '--help' in argv:
+        return
+
+    line = request(script, argv)
+    if line is None:
+        return
+
+    os.write(1, line)
+    sys.exit(0 if loads(line).get('success') else 1)
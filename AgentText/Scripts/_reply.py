@@ -0,0 +1,49 @@
+"""
+JSON reply helpers shared by the AgentText scripts
+
+Only the standard library (and orjson, when installed) is imported here so
+_lite_client.py can use it before the heavier imports.
+"""
+
+import os
+import sys
+
+try:
+    import orjson
+    dumps = orjson.dumps
+    loads = orjson.loads
+
+    def dumps_pretty(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    import json
+
+    def dumps(obj):
+        return json.dumps(obj).encode()
+
+    def dumps_pretty(obj):
+        return json.dumps(obj, indent=2).encode()
+    loads = json.loads
+
+ERR = b'{"success": false, "error": %b}\n'
+
+
+def fail(message):
+    """Write an error reply to stdout and exit with status 1"""
+    os.write(1, ERR % dumps(message))
+    sys.exit(1)
+
+
+def emit(payload):
+    """Write one JSON line to stdout with a single write() call"""
+    os.write(1, dumps(payload) + b'\n')
+
+
+def emit_pretty(payload):
+    """Write the payload to stdout as indented JSON
+
+    Reader replies can be large, so this goes through the buffered writer,
+    which retries short writes, rather than a bare os.write().
+    """
+    sys.stdout.buffer.write(dumps_pretty(payload) + b'\n')
+    sys.stdout.buffer.flush()
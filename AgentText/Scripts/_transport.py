@@ -0,0 +1,69 @@
+"""
+Shared connection setup for the AgentText scripts
+"""
+
+import socket
+import functools
+import urllib.parse
+
+# Keep small JSON requests out of Nagle's algorithm and probe idle keep-alive
+# connections so a dead API server is noticed within about 30 seconds
+_KEEPIDLE = getattr(socket, 'TCP_KEEPIDLE', getattr(socket, 'TCP_KEEPALIVE', None))
+SOCKET_OPTIONS = [
+    (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+] + [
+    (socket.IPPROTO_TCP, option, value)
+    for option, value in ((_KEEPIDLE, 15), (getattr(socket, 'TCP_KEEPINTVL', None), 5),
+                          (getattr(socket, 'TCP_KEEPCNT', None), 3))
+    if option is not None
+]
+
+
+@functools.lru_cache(maxsize=None)
+def resolve_base_url(base_url):
+    """Pin an http://localhost base URL to 127.0.0.1 so connecting skips name resolution"""
+    parts = urllib.parse.urlsplit(base_url)
+    if parts.scheme != 'http' or parts.hostname != 'localhost':
+        return base_url
+
+    userinfo, _, _ = parts.netloc.rpartition('@')
+    netloc = '127.0.0.1' if parts.port is None else f'127.0.0.1:{parts.port}'
+    return parts._replace(netloc=f'{userinfo}@{netloc}' if userinfo else netloc).geturl()
+
+
+def make_session():
+    """Build a keep-alive requests.Session whose sockets use SOCKET_OPTIONS"""
+    # requests is imported here so scripts served by the daemon never load it
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    class _TunedAdapter(HTTPAdapter):
+        def init_poolmanager(self, *args, **kwargs):
+            kwargs['socket_options'] = SOCKET_OPTIONS
+            super().init_poolmanager(*args, **kwargs)
+
+    session = requests.Session()
+    adapter = _TunedAdapter(pool_connections=1, pool_maxsize=32)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def make_client(base_url, timeout=30):
+    """Build an AgentText client for base_url on a tuned session"""
+    from agenttext import AgentText
+
+    base_url = resolve_base_url(base_url)
+    session = make_session()
+    try:
+        return AgentText(base_url=base_url, timeout=timeout, session=session)
+    except TypeError:
+        # Older agenttext releases build their own session; swap ours in only
+        # where the client keeps one, otherwise leave the client untouched
+        client = AgentText(base_url=base_url, timeout=timeout)
+        if hasattr(client, '_session'):
+            client._session = session
+        else:
+            session.close()
+        return client
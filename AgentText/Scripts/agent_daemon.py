@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Serve the AgentText scripts from one long-lived process over a Unix socket
+Usage: agent_daemon.py [--socket /tmp/agenttext.sock]
+
+While the daemon is running, send_message.py, send_file.py, get_messages.py,
+get_unread.py, list_chats.py and watcher.py forward their arguments to it
+instead of building their own client, so the agenttext import, client
+construction and HTTP keep-alive pool are paid once.
+
+Protocol (newline-delimited JSON):
+  request: {"script": "send_message", "argv": ["+1234567890", "Hello!"]}
+  reply:   the JSON object the script itself would have printed
+
+If the daemon cannot handle a request it replies {"declined": true} and the
+script falls back to running on its own. The client side lives in
+_lite_client.py.
+"""
+
+import os
+import sys
+import json
+import signal
+import socket
+import argparse
+import importlib
+import threading
+import socketserver
+
+from _lite_client import DECLINED
+from _transport import make_client
+
+SOCKET_PATH = os.environ.get('AGENTTEXT_SOCKET', '/tmp/agenttext.sock')
+
+# Scripts that expose run(client, args) and can be served in-process
+SCRIPTS = ('send_message', 'send_file', 'get_messages', 'get_unread', 'list_chats', 'watcher')
+
+_PARSER = argparse.ArgumentParser(description='Serve AgentText scripts over a Unix socket')
+_PARSER.add_argument('--socket', default=SOCKET_PATH, help='Unix socket path')
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    """Answer each request line on a connection until the client hangs up"""
+
+    def handle(self):
+        for line in self.rfile:
+            reply = self.server.dispatch(line)
+            if reply is None:
+                self.wfile.write(DECLINED)
+                return
+            self.wfile.write(json.dumps(reply).encode() + b'\n')
+
+
+class AgentDaemon(socketserver.ThreadingUnixStreamServer):
+    """Unix socket server holding one AgentText client per base URL"""
+
+    daemon_threads = True
+
+    def __init__(self, path):
+        self._clients = {}
+        self._clients_lock = threading.Lock()
+        super().__init__(path, _Handler)
+
+    def client(self, base_url):
+        """Return the shared client for base_url, creating it on first use"""
+        with self._clients_lock:
+            client = self._clients.get(base_url)
+            if client is None:
+                client = self._clients[base_url] = make_client(base_url)
+            return client
+
+    def dispatch(self, line):
+        """Run one request line and return the script's reply, or None to decline it"""
+        from agenttext import AgentTextAPIException, AgentTextConnectionException
+
+        try:
+            request = json.loads(line)
+            if request['script'] not in SCRIPTS:
+                return None
+            module = importlib.import_module(request['script'])
+            args = module._PARSER.parse_args(request['argv'])
+        except (ValueError, KeyError, TypeError, SystemExit):
+            return None
+
+        try:
+            return module.run(self.client(args.base_url), args)
+        except AgentTextConnectionException as e:
+            return {
+                "success": False,
+                "error": f"Connection error: {str(e)}. Make sure the API server is running on {args.base_url}"
+            }
+        except AgentTextAPIException as e:
+            return {
+                "success": False,
+                "error": f"API error: {str(e)}"
+            }
+        except Exception as e:
+            return {
+                "success": False,
+                "error": str(e)
+            }
+
+
+def main():
+    args = _PARSER.parse_args()
+
+    try:
+        import agenttext  # noqa: F401 - fail fast instead of on the first request
+    except ImportError:
+        print(json.dumps({
+            "success": False,
+            "error": "AgentText package not installed. Run: pip3 install -e /path/to/agenttext_package"
+        }))
+        sys.exit(1)
+
+    # Scripts are imported by name when their first request arrives
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+    # Clear a socket left behind by a previous daemon, but never a live one
+    if os.path.exists(args.socket):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            try:
+                probe.connect(args.socket)
+            except ConnectionRefusedError:
+                os.unlink(args.socket)
+            else:
+                print(json.dumps({
+                    "success": False,
+                    "error": f"AgentText daemon already running on {args.socket}"
+                }))
+                sys.exit(1)
+
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+
+    server = AgentDaemon(args.socket)
+    os.chmod(args.socket, 0o600)
+
+    print(json.dumps({
+        "success": True,
+        "message": f"AgentText daemon listening on {args.socket}"
+    }), flush=True)
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        os.unlink(args.socket)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 """
-Send batch messages using the AgentText Python package
+Send batch messages concurrently through the AgentText API server
 Usage: batch_send.py <json_file>
 
 JSON file format:
@@ -10,81 +10,164 @@ JSON file format:
 ]
 """
 
-import sys
+import os
 import json
+import asyncio
 import argparse
+from multiprocessing import Pool
+
+from _reply import fail, loads
+from _transport import resolve_base_url
 
 try:
-    from agenttext import AgentText, AgentTextAPIException, AgentTextConnectionException
+    import aiohttp
 except ImportError:
-    print(json.dumps({
-        "success": False,
-        "error": "AgentText package not installed. Run: pip3 install -e /path/to/agenttext_package"
-    }))
-    sys.exit(1)
+    fail("aiohttp not installed. Run: pip3 install aiohttp")
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
-def main():
-    parser = argparse.ArgumentParser(description='Send batch messages via AgentText')
-    parser.add_argument('json_file', help='JSON file with message array')
-    parser.add_argument('--base-url', default='http://localhost:3000', help='API base URL')
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+_PARSER = argparse.ArgumentParser(description='Send batch messages via AgentText')
+_PARSER.add_argument('json_file', help='JSON file with message array')
+_PARSER.add_argument('--base-url', default='http://localhost:3000', help='API base URL')
+_PARSER.add_argument('--http2', action='store_true',
+                     help='Multiplex sends over one HTTP/2 connection (https:// base URLs only; needs httpx[http2])')
+
+# Maximum number of sends in flight at once, across all worker processes
+MAX_CONCURRENCY = 32
+
+# Batches larger than this are sharded across up to MAX_WORKERS processes,
+# each with its own event loop, connection pool and share of MAX_CONCURRENCY
+SHARD_THRESHOLD = 10000
+MAX_WORKERS = 8
+
+# Failures that mean the API server could not be reached at all
+_CONNECTION_ERRORS = (aiohttp.ClientConnectionError,) + ((httpx.ConnectError,) if httpx else ())
+
+
+def _decode(status, body):
+    """Return a /send response body, raising if the server reported an error"""
+    if status >= 400:
+        detail = body.get('message') or body.get('error') if isinstance(body, dict) else body
+        raise RuntimeError(f"API error: {detail}")
+    return body
+
+
+async def _post_one(session, semaphore, url, message):
+    """POST a single message to /send and return the decoded response"""
+    async with semaphore:
+        async with session.post(url, json=message) as response:
+            return _decode(response.status, await response.json(content_type=None))
+
+
+async def _post_one_h2(client, semaphore, url, message):
+    """POST a single message to /send as one stream on the HTTP/2 connection"""
+    async with semaphore:
+        response = await client.post(url, json=message)
+        return _decode(response.status_code, response.json())
+
+
+async def _send_all(messages, base_url, http2=False, concurrency=MAX_CONCURRENCY):
+    """Fan the messages out over one keep-alive session, preserving input order"""
+    url = f"{resolve_base_url(base_url).rstrip('/')}/send"
+    semaphore = asyncio.Semaphore(concurrency)
+
+    if http2:
+        # HTTP/2 is negotiated through TLS ALPN; plain http:// stays on HTTP/1.1
+        limits = httpx.Limits(max_connections=concurrency)
+        async with httpx.AsyncClient(http2=True, limits=limits, timeout=30) as client:
+            tasks = [asyncio.create_task(_post_one_h2(client, semaphore, url, m)) for m in messages]
+            return await asyncio.gather(*tasks, return_exceptions=True)
 
-    args = parser.parse_args()
+    connector = aiohttp.TCPConnector(limit=concurrency, keepalive_timeout=60)
+    timeout = aiohttp.ClientTimeout(total=None, sock_read=30)
+
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        tasks = [asyncio.create_task(_post_one(session, semaphore, url, m)) for m in messages]
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def _to_result(message, outcome):
+    """Shape one gather() outcome like the server's /send/batch entries"""
+    to = str(message.get('to')) if isinstance(message, dict) else None
+    if isinstance(outcome, BaseException):
+        return {"to": to, "success": False, "error": str(outcome)}
+    return {"to": to, "success": True, "result": outcome}
+
+
+def _send_shard(job):
+    """Send one list of messages on a fresh event loop
+
+    Returns the per-message results and the connection errors seen, as plain
+    data so a worker process can hand them back through the pool.
+    """
+    messages, base_url, http2, concurrency = job
+    if uvloop is not None:
+        uvloop.install()
+
+    outcomes = asyncio.run(_send_all(messages, base_url, http2=http2, concurrency=concurrency))
+    refused = [str(o) for o in outcomes if isinstance(o, _CONNECTION_ERRORS)]
+    return [_to_result(m, o) for m, o in zip(messages, outcomes)], refused
+
+
+def main():
+    args = _PARSER.parse_args()
 
     try:
         # Read messages from JSON file
-        with open(args.json_file, 'r') as f:
-            messages = json.load(f)
+        with open(args.json_file, 'rb', buffering=1 << 20) as f:
+            messages = loads(f.read())
 
         if not isinstance(messages, list):
-            print(json.dumps({
-                "success": False,
-                "error": "JSON file must contain an array of messages"
-            }))
-            sys.exit(1)
+            fail("JSON file must contain an array of messages")
 
-        # Initialize AgentText client
-        client = AgentText(base_url=args.base_url, timeout=30)
+        if args.http2 and httpx is None:
+            fail("httpx not installed. Run: pip3 install 'httpx[http2]'")
 
-        # Send batch
-        results = client.messages.send_batch(messages)
+        workers = min(os.cpu_count() or 1, MAX_WORKERS) if len(messages) > SHARD_THRESHOLD else 1
+
+        # Send all messages concurrently
+        if workers > 1:
+            # Split MAX_CONCURRENCY between the workers so the server never
+            # sees more sends in flight than a single process would make
+            concurrency = MAX_CONCURRENCY // workers
+            shards = [messages[i::workers] for i in range(workers)]
+            with Pool(workers) as pool:
+                parts = pool.map(_send_shard, [(shard, args.base_url, args.http2, concurrency) for shard in shards])
+
+            # Re-interleave the shards back into input order
+            results = [None] * len(messages)
+            refused = []
+            for i, (shard_results, shard_refused) in enumerate(parts):
+                results[i::workers] = shard_results
+                refused.extend(shard_refused)
+        else:
+            results, refused = _send_shard((messages, args.base_url, args.http2, MAX_CONCURRENCY))
+
+        if messages and len(refused) == len(messages):
+            fail(f"Connection error: {refused[0]}. Make sure the API server is running on {args.base_url}")
+
+        sent = sum(1 for r in results if r["success"])
 
         print(json.dumps({
             "success": True,
-            "message": f"Sent {len(messages)} messages",
-            "results": results if isinstance(results, list) else []
+            "message": f"Sent {sent} of {len(messages)} messages",
+            "results": results
         }, indent=2))
 
     except FileNotFoundError:
-        print(json.dumps({
-            "success": False,
-            "error": f"File not found: {args.json_file}"
-        }))
-        sys.exit(1)
-    except json.JSONDecodeError as e:
-        print(json.dumps({
-            "success": False,
-            "error": f"Invalid JSON: {str(e)}"
-        }))
-        sys.exit(1)
-    except AgentTextConnectionException as e:
-        print(json.dumps({
-            "success": False,
-            "error": f"Connection error: {str(e)}. Make sure the API server is running on {args.base_url}"
-        }))
-        sys.exit(1)
-    except AgentTextAPIException as e:
-        print(json.dumps({
-            "success": False,
-            "error": f"API error: {str(e)}"
-        }))
-        sys.exit(1)
+        fail(f"File not found: {args.json_file}")
+    except json.JSONDecodeError as e:  # orjson.JSONDecodeError is a subclass
+        fail(f"Invalid JSON: {str(e)}")
     except Exception as e:
-        print(json.dumps({
-            "success": False,
-            "error": str(e)
-        }))
-        sys.exit(1)
+        fail(str(e))
 
 
 if __name__ == "__main__":
@@ -5,66 +5,66 @@ Usage: get_messages.py [--limit 10] [--sender "+1234567890"] [--unread-only]
 """
 
 import sys
-import json
 import argparse
 
-try:
-    from agenttext import AgentText, AgentTextAPIException, AgentTextConnectionException
-except ImportError:
-    print(json.dumps({
-        "success": False,
-        "error": "AgentText package not installed. Run: pip3 install -e /path/to/agenttext_package"
-    }))
-    sys.exit(1)
+from _lite_client import forward
+from _reply import emit_pretty, fail
+from _transport import make_client
+
+_PARSER = argparse.ArgumentParser(description='Get messages via AgentText')
+_PARSER.add_argument('--limit', type=int, default=10, help='Maximum number of messages')
+_PARSER.add_argument('--sender', help='Filter by sender phone/email')
+_PARSER.add_argument('--unread-only', action='store_true', help='Only unread messages')
+_PARSER.add_argument('--base-url', default='http://localhost:3000', help='API base URL')
+
+
+def run(client, args):
+    """Fetch messages and return the JSON reply"""
+    # Build filters
+    filters = {'limit': args.limit}
+    if args.sender:
+        filters['sender'] = args.sender
+    if args.unread_only:
+        filters['unreadOnly'] = True
+
+    # Get messages
+    messages = client.messages.list(**filters)
+    is_list = isinstance(messages, list)
+
+    return {
+        "success": True,
+        "messages": messages if is_list or isinstance(messages, dict) else [],
+        "count": len(messages) if is_list else 0
+    }
 
 
 def main():
-    parser = argparse.ArgumentParser(description='Get messages via AgentText')
-    parser.add_argument('--limit', type=int, default=10, help='Maximum number of messages')
-    parser.add_argument('--sender', help='Filter by sender phone/email')
-    parser.add_argument('--unread-only', action='store_true', help='Only unread messages')
-    parser.add_argument('--base-url', default='http://localhost:3000', help='API base URL')
+    args = _PARSER.parse_args()
 
-    args = parser.parse_args()
+    # Hand off to agent_daemon.py when it is running
+    reply = forward('get_messages', sys.argv[1:])
+    if reply is not None:
+        emit_pretty(reply)
+        sys.exit(0 if reply.get('success') else 1)
 
+    # Only pay for the agenttext import when running without the daemon
     try:
-        # Initialize AgentText client
-        client = AgentText(base_url=args.base_url, timeout=30)
-
-        # Build filters
-        filters = {'limit': args.limit}
-        if args.sender:
-            filters['sender'] = args.sender
-        if args.unread_only:
-            filters['unreadOnly'] = True
+        from agenttext import AgentTextAPIException, AgentTextConnectionException
+    except ImportError:
+        fail("AgentText package not installed. Run: pip3 install -e /path/to/agenttext_package")
 
-        # Get messages
-        messages = client.messages.list(**filters)
+    try:
+        # Initialize AgentText client
+        client = make_client(args.base_url)
 
-        print(json.dumps({
-            "success": True,
-            "messages": messages if isinstance(messages, (list, dict)) else [],
-            "count": len(messages) if isinstance(messages, list) else 0
-        }, indent=2))
+        emit_pretty(run(client, args))
 
     except AgentTextConnectionException as e:
-        print(json.dumps({
-            "success": False,
-            "error": f"Connection error: {str(e)}. Make sure the API server is running on {args.base_url}"
-        }))
-        sys.exit(1)
+        fail(f"Connection error: {str(e)}. Make sure the API server is running on {args.base_url}")
     except AgentTextAPIException as e:
-        print(json.dumps({
-            "success": False,
-            "error": f"API error: {str(e)}"
-        }))
-        sys.exit(1)
+        fail(f"API error: {str(e)}")
     except Exception as e:
-        print(json.dumps({
-            "success": False,
-            "error": str(e)
-        }))
-        sys.exit(1)
+        fail(str(e))
 
 
 if __name__ == "__main__":
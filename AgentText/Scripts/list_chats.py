@@ -5,63 +5,64 @@ Usage: list_chats.py [--limit 20] [--type group|direct]
 """
 
 import sys
-import json
 import argparse
 
-try:
-    from agenttext import AgentText, AgentTextAPIException, AgentTextConnectionException
-except ImportError:
-    print(json.dumps({
-        "success": False,
-        "error": "AgentText package not installed. Run: pip3 install -e /path/to/agenttext_package"
-    }))
-    sys.exit(1)
+from _lite_client import forward
+from _reply import emit_pretty, fail
+from _transport import make_client
+
+_PARSER = argparse.ArgumentParser(description='List chats via AgentText')
+_PARSER.add_argument('--limit', type=int, default=20, help='Maximum number of chats')
+_PARSER.add_argument('--type', choices=['group', 'direct'], help='Filter by chat type')
+_PARSER.add_argument('--base-url', default='http://localhost:3000', help='API base URL')
+
+
+def run(client, args):
+    """List chats and return the JSON reply"""
+    # Build filters
+    filters = {'limit': args.limit}
+    if args.type:
+        filters['type'] = args.type
+
+    # List chats
+    chats = client.chats.list(**filters)
+    if not isinstance(chats, list):
+        chats = []
+
+    return {
+        "success": True,
+        "chats": chats,
+        "count": len(chats)
+    }
 
 
 def main():
-    parser = argparse.ArgumentParser(description='List chats via AgentText')
-    parser.add_argument('--limit', type=int, default=20, help='Maximum number of chats')
-    parser.add_argument('--type', choices=['group', 'direct'], help='Filter by chat type')
-    parser.add_argument('--base-url', default='http://localhost:3000', help='API base URL')
+    args = _PARSER.parse_args()
 
-    args = parser.parse_args()
+    # Hand off to agent_daemon.py when it is running
+    reply = forward('list_chats', sys.argv[1:])
+    if reply is not None:
+        emit_pretty(reply)
+        sys.exit(0 if reply.get('success') else 1)
 
+    # Only pay for the agenttext import when running without the daemon
     try:
-        # Initialize AgentText client
-        client = AgentText(base_url=args.base_url, timeout=30)
-
-        # Build filters
-        filters = {'limit': args.limit}
-        if args.type:
-            filters['type'] = args.type
+        from agenttext import AgentTextAPIException, AgentTextConnectionException
+    except ImportError:
+        fail("AgentText package not installed. Run: pip3 install -e /path/to/agenttext_package")
 
-        # List chats
-        chats = client.chats.list(**filters)
+    try:
+        # Initialize AgentText client
+        client = make_client(args.base_url)
 
-        print(json.dumps({
-            "success": True,
-            "chats": chats if isinstance(chats, list) else [],
-            "count": len(chats) if isinstance(chats, list) else 0
-        }, indent=2))
+        emit_pretty(run(client, args))
 
     except AgentTextConnectionException as e:
-        print(json.dumps({
-            "success": False,
-            "error": f"Connection error: {str(e)}. Make sure the API server is running on {args.base_url}"
-        }))
-        sys.exit(1)
+        fail(f"Connection error: {str(e)}. Make sure the API server is running on {args.base_url}")
     except AgentTextAPIException as e:
-        print(json.dumps({
-            "success": False,
-            "error": f"API error: {str(e)}"
-        }))
-        sys.exit(1)
+        fail(f"API error: {str(e)}")
     except Exception as e:
-        print(json.dumps({
-            "success": False,
-            "error": str(e)
-        }))
-        sys.exit(1)
+        fail(str(e))
 
 
 if __name__ == "__main__":
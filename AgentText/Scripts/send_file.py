@@ -8,70 +8,74 @@ import sys
 import json
 import argparse
 import os
+import stat
 
-try:
-    from agenttext import AgentText, AgentTextAPIException, AgentTextConnectionException
-except ImportError:
-    print(json.dumps({
-        "success": False,
-        "error": "AgentText package not installed. Run: pip3 install -e /path/to/agenttext_package"
-    }))
-    sys.exit(1)
+from _lite_client import forward
+from _reply import fail
+from _transport import make_client
+
+_PARSER = argparse.ArgumentParser(description='Send file via iMessage')
+_PARSER.add_argument('recipient', help='Recipient phone number or email')
+_PARSER.add_argument('file_path', help='Path to file to send')
+_PARSER.add_argument('--text', help='Optional message text', default=None)
+_PARSER.add_argument('--base-url', default='http://localhost:3000', help='API base URL')
+
+
+def run(client, args):
+    """Send the file and return the JSON reply"""
+    # Send file. Only the path goes over the wire: the API server attaches
+    # the file from disk, so its contents are never read or copied here
+    result = client.messages.send_file(
+        to=args.recipient,
+        file_path=args.file_path,
+        text=args.text
+    )
+
+    return {
+        "success": True,
+        "message": f"File sent to {args.recipient}",
+        "file": args.file_path,
+        "result": result if isinstance(result, dict) else str(result)
+    }
 
 
 def main():
-    parser = argparse.ArgumentParser(description='Send file via iMessage')
-    parser.add_argument('recipient', help='Recipient phone number or email')
-    parser.add_argument('file_path', help='Path to file to send')
-    parser.add_argument('--text', help='Optional message text', default=None)
-    parser.add_argument('--base-url', default='http://localhost:3000', help='API base URL')
-
-    args = parser.parse_args()
-
-    # Validate file exists
-    if not os.path.exists(args.file_path):
-        print(json.dumps({
-            "success": False,
-            "error": f"File not found: {args.file_path}"
-        }))
-        sys.exit(1)
+    args = _PARSER.parse_args()
+
+    # Validate file exists and is a regular file (one stat() call)
+    try:
+        st = os.stat(args.file_path)
+    except FileNotFoundError:
+        fail(f"File not found: {args.file_path}")
+    except OSError as e:
+        fail(str(e))
+    if not stat.S_ISREG(st.st_mode):
+        fail(f"Not a regular file: {args.file_path}")
+
+    # Hand off to agent_daemon.py when it is running
+    reply = forward('send_file', sys.argv[1:])
+    if reply is not None:
+        print(json.dumps(reply))
+        sys.exit(0 if reply.get('success') else 1)
+
+    # Only pay for the agenttext import when running without the daemon
+    try:
+        from agenttext import AgentTextAPIException, AgentTextConnectionException
+    except ImportError:
+        fail("AgentText package not installed. Run: pip3 install -e /path/to/agenttext_package")
 
     try:
         # Initialize AgentText client
-        client = AgentText(base_url=args.base_url, timeout=30)
-
-        # Send file
-        result = client.messages.send_file(
-            to=args.recipient,
-            file_path=args.file_path,
-            text=args.text
-        )
-
-        print(json.dumps({
-            "success": True,
-            "message": f"File sent to {args.recipient}",
-            "file": args.file_path,
-            "result": result if isinstance(result, dict) else str(result)
-        }))
+        client = make_client(args.base_url)
+
+        print(json.dumps(run(client, args)))
 
     except AgentTextConnectionException as e:
-        print(json.dumps({
-            "success": False,
-            "error": f"Connection error: {str(e)}. Make sure the API server is running on {args.base_url}"
-        }))
-        sys.exit(1)
+        fail(f"Connection error: {str(e)}. Make sure the API server is running on {args.base_url}")
     except AgentTextAPIException as e:
-        print(json.dumps({
-            "success": False,
-            "error": f"API error: {str(e)}"
-        }))
-        sys.exit(1)
+        fail(f"API error: {str(e)}")
     except Exception as e:
-        print(json.dumps({
-            "success": False,
-            "error": str(e)
-        }))
-        sys.exit(1)
+        fail(str(e))
 
 
 if __name__ == "__main__":
@@ -5,70 +5,70 @@ Usage: send_message.py <recipient> <message> [--files file1,file2]
 """
 
 import sys
-import json
+
+import _lite_client
+
+# Fast path: when agent_daemon.py is running, hand the arguments over before
+# argparse, requests or agenttext are imported
+if __name__ == "__main__":
+    _lite_client.run('send_message', sys.argv[1:])
+
 import argparse
 
-try:
-    from agenttext import AgentText, AgentTextAPIException, AgentTextConnectionException
-except ImportError:
-    print(json.dumps({
-        "success": False,
-        "error": "AgentText package not installed. Run: pip3 install -e /path/to/agenttext_package"
-    }))
-    sys.exit(1)
+from _reply import emit, fail
+from _transport import make_client
+
+_PARSER = argparse.ArgumentParser(description='Send iMessage via AgentText')
+_PARSER.add_argument('recipient', help='Recipient phone number or email')
+_PARSER.add_argument('message', help='Message text')
+_PARSER.add_argument('--files', help='Comma-separated file paths', default=None)
+_PARSER.add_argument('--base-url', default='http://localhost:3000', help='API base URL')
+
+
+def run(client, args):
+    """Send the message and return the JSON reply"""
+    # Send message with optional files
+    if args.files:
+        file_paths = [f.strip() for f in args.files.split(',')]
+        result = client.messages.send_files(
+            to=args.recipient,
+            file_paths=file_paths,
+            text=args.message
+        )
+    else:
+        result = client.messages.send(
+            to=args.recipient,
+            content=args.message
+        )
+
+    return {
+        "success": True,
+        "message": f"Message sent to {args.recipient}",
+        "result": result if isinstance(result, dict) else str(result)
+    }
 
 
 def main():
-    parser = argparse.ArgumentParser(description='Send iMessage via AgentText')
-    parser.add_argument('recipient', help='Recipient phone number or email')
-    parser.add_argument('message', help='Message text')
-    parser.add_argument('--files', help='Comma-separated file paths', default=None)
-    parser.add_argument('--base-url', default='http://localhost:3000', help='API base URL')
+    args = _PARSER.parse_args()
 
-    args = parser.parse_args()
+    # Only pay for the agenttext import when running without the daemon
+    try:
+        from agenttext import AgentTextAPIException, AgentTextConnectionException
+    except ImportError:
+        fail("AgentText package not installed. Run: pip3 install -e /path/to/agenttext_package")
 
     try:
         # Initialize AgentText client
-        client = AgentText(base_url=args.base_url, timeout=30)
-
-        # Send message with optional files
-        if args.files:
-            file_paths = [f.strip() for f in args.files.split(',')]
-            result = client.messages.send_files(
-                to=args.recipient,
-                file_paths=file_paths,
-                text=args.message
-            )
-        else:
-            result = client.messages.send(
-                to=args.recipient,
-                content=args.message
-            )
-
-        print(json.dumps({
-            "success": True,
-            "message": f"Message sent to {args.recipient}",
-            "result": result if isinstance(result, dict) else str(result)
-        }))
+        client = make_client(args.base_url)
+
+        emit(run(client, args))
 
     except AgentTextConnectionException as e:
-        print(json.dumps({
-            "success": False,
-            "error": f"Connection error: {str(e)}. Make sure the API server is running on {args.base_url}"
-        }))
-        sys.exit(1)
+        fail(f"Connection error: {str(e)}. Make sure the API server is running on {args.base_url}")
     except AgentTextAPIException as e:
-        print(json.dumps({
-            "success": False,
-            "error": f"API error: {str(e)}"
-        }))
-        sys.exit(1)
+        fail(f"API error: {str(e)}")
     except Exception as e:
-        print(json.dumps({
-            "success": False,
-            "error": str(e)
-        }))
-        sys.exit(1)
+        fail(str(e))
 
 
 if __name__ == "__main__":
@@ -4,17 +4,13 @@ Simple test script using the agenttext library
 This sends a test message to verify the integration is working
 """
 
-import sys
-import json
+from _reply import emit, fail
 
 try:
     from agenttext import AgentText
 except ImportError:
-    print(json.dumps({
-        "success": False,
-        "error": "AgentText package not installed. Run: pip3 install -e /path/to/agenttext_package"
-    }))
-    sys.exit(1)
+    fail("AgentText package not installed. Run: pip3 install -e /path/to/agenttext_package")
+
 
 def main():
     try:
@@ -24,18 +20,14 @@ def main():
         # Send a message
         result = client.messages.send(to="+9255776728", content="Hello!")
 
-        print(json.dumps({
+        emit({
             "success": True,
             "message": "Test message sent successfully!",
             "result": result if isinstance(result, dict) else str(result)
-        }))
+        })
 
     except Exception as e:
-        print(json.dumps({
-            "success": False,
-            "error": str(e)
-        }))
-        sys.exit(1)
+        fail(str(e))
 
 
 if __name__ == "__main__":
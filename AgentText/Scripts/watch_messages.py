@@ -2,58 +2,151 @@
 """
 Watch for new messages using the AgentText Python package
 This is a long-running script that monitors for new messages
+Usage: watch_messages.py [--webhook-port 8765]
 """
 
 import sys
 import json
-import time
+import signal
+import asyncio
+import argparse
+import threading
+
+from _reply import dumps, fail
+from _transport import make_client
 
 try:
-    from agenttext import AgentText
+    import agenttext  # noqa: F401
 except ImportError:
-    print(json.dumps({
-        "success": False,
-        "error": "AgentText package not installed. Run: pip3 install agenttext"
-    }))
-    sys.exit(1)
+    fail("AgentText package not installed. Run: pip3 install agenttext")
+
+_PARSER = argparse.ArgumentParser(description='Watch for new messages via AgentText')
+_PARSER.add_argument('--webhook-port', type=int, default=None,
+                     help='Have the server POST new messages to a local webhook on this port')
+_PARSER.add_argument('--base-url', default='http://localhost:3000', help='API base URL')
+
+# Events are written in batches: once FLUSH_BATCH are pending, or
+# FLUSH_INTERVAL seconds after the first one arrives
+FLUSH_BATCH = 16
+FLUSH_INTERVAL = 0.05
+
+_OUT = sys.stdout.buffer
+_pending = []
+_pending_lock = threading.Lock()
+_flush_timer = None
+
+
+def _flush():
+    """Write all pending events to stdout with a single write + flush"""
+    global _flush_timer
+    with _pending_lock:
+        if _flush_timer is not None:
+            _flush_timer.cancel()
+            _flush_timer = None
+        if not _pending:
+            return
+        _OUT.write(b'\n'.join(_pending) + b'\n')
+        _OUT.flush()
+        _pending.clear()
 
 
 def on_message(message):
     """Callback for new messages"""
-    print(json.dumps({
+    global _flush_timer
+    line = dumps({
         "event": "message",
         "data": message if isinstance(message, dict) else str(message)
-    }), flush=True)
+    })
+    with _pending_lock:
+        _pending.append(line)
+        if len(_pending) < FLUSH_BATCH:
+            if _flush_timer is None:
+                _flush_timer = threading.Timer(FLUSH_INTERVAL, _flush)
+                _flush_timer.daemon = True
+                _flush_timer.start()
+            return
+    _flush()
+
+
+def _start_webhook(client, port):
+    """Serve /hook on 127.0.0.1:port and point the server's watcher at it
+
+    Returns False, with the watcher and receiver stopped again, if the server
+    ignored the webhook so the caller can fall back to the callback watcher.
+    """
+    try:
+        from aiohttp import web
+    except ImportError:
+        fail("aiohttp not installed. Run: pip3 install aiohttp")
+
+    async def handle(request):
+        try:
+            payload = await request.json()
+        except ValueError:
+            return web.Response(status=400, text='Invalid JSON')
+        on_message(payload.get('message', payload) if isinstance(payload, dict) else payload)
+        return web.Response(status=204)
+
+    app = web.Application()
+    app.router.add_post('/hook', handle)
+
+    # Bind in this thread so port errors surface here, then serve in the background
+    loop = asyncio.new_event_loop()
+    runner = web.AppRunner(app)
+    loop.run_until_complete(runner.setup())
+    loop.run_until_complete(web.TCPSite(runner, '127.0.0.1', port).start())
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+
+    # Ask for the full message so events match the callback watcher's output
+    result = client.watcher.start(webhook={'url': f'http://127.0.0.1:{port}/hook', 'fullMessage': True})
+    if isinstance(result, dict) and result.get('webhook'):
+        return True
+
+    # Release the port again before falling back
+    client.watcher.stop()
+    asyncio.run_coroutine_threadsafe(runner.cleanup(), loop).result()
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.close()
+    return False
 
 
 def main():
+    args = _PARSER.parse_args()
+
+    # Park the main thread until SIGINT/SIGTERM instead of polling
+    stop = threading.Event()
+    signal.signal(signal.SIGINT, lambda *_: stop.set())
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+
     try:
         # Initialize AgentText client
-        client = AgentText(base_url="http://localhost:3000")
+        client = make_client(args.base_url)
 
         print(json.dumps({
             "success": True,
             "message": "Starting message watcher..."
         }), flush=True)
 
-        # Start watching (this will use polling or webhooks)
-        client.watcher.start(callback=on_message)
+        # Prefer server push to a local webhook; otherwise use the SDK's callback watcher
+        if not (args.webhook_port and _start_webhook(client, args.webhook_port)):
+            client.watcher.start(callback=on_message)
 
-        # Keep the script running
-        while True:
-            time.sleep(1)
+        # Keep the script running until a signal arrives
+        try:
+            stop.wait()
+        finally:
+            client.watcher.stop()
+            _flush()
 
-    except KeyboardInterrupt:
         print(json.dumps({
             "success": True,
             "message": "Watcher stopped"
         }), flush=True)
+
     except Exception as e:
-        print(json.dumps({
-            "success": False,
-            "error": str(e)
-        }), flush=True)
-        sys.exit(1)
+        fail(str(e))
 
 
 if __name__ == "__main__":
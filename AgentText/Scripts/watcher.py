@@ -11,73 +11,74 @@ import sys
 import json
 import argparse
 
-try:
-    from agenttext import AgentText, AgentTextAPIException, AgentTextConnectionException
-except ImportError:
-    print(json.dumps({
-        "success": False,
-        "error": "AgentText package not installed. Run: pip3 install -e /path/to/agenttext_package"
-    }))
-    sys.exit(1)
+from _lite_client import forward
+from _reply import fail
+from _transport import make_client
+
+_PARSER = argparse.ArgumentParser(description='Manage message watcher via AgentText')
+_PARSER.add_argument('action', choices=['start', 'stop', 'status'], help='Watcher action')
+_PARSER.add_argument('--webhook-url', help='Webhook URL for message notifications')
+_PARSER.add_argument('--base-url', default='http://localhost:3000', help='API base URL')
+
+
+def run(client, args):
+    """Perform the watcher action and return the JSON reply"""
+    if args.action == 'start':
+        webhook = {'url': args.webhook_url} if args.webhook_url else None
+        result = client.watcher.start(webhook=webhook)
+        return {
+            "success": True,
+            "action": "start",
+            "message": "Watcher started",
+            "result": result if isinstance(result, dict) else str(result)
+        }
+
+    elif args.action == 'stop':
+        result = client.watcher.stop()
+        return {
+            "success": True,
+            "action": "stop",
+            "message": "Watcher stopped",
+            "result": result if isinstance(result, dict) else str(result)
+        }
+
+    elif args.action == 'status':
+        result = client.watcher.status()
+        return {
+            "success": True,
+            "action": "status",
+            "status": result if isinstance(result, dict) else str(result)
+        }
 
 
 def main():
-    parser = argparse.ArgumentParser(description='Manage message watcher via AgentText')
-    parser.add_argument('action', choices=['start', 'stop', 'status'], help='Watcher action')
-    parser.add_argument('--webhook-url', help='Webhook URL for message notifications')
-    parser.add_argument('--base-url', default='http://localhost:3000', help='API base URL')
+    args = _PARSER.parse_args()
+    indent = 2 if args.action == 'status' else None
+
+    # Hand off to agent_daemon.py when it is running
+    reply = forward('watcher', sys.argv[1:])
+    if reply is not None:
+        print(json.dumps(reply, indent=indent))
+        sys.exit(0 if reply.get('success') else 1)
 
-    args = parser.parse_args()
+    # Only pay for the agenttext import when running without the daemon
+    try:
+        from agenttext import AgentTextAPIException, AgentTextConnectionException
+    except ImportError:
+        fail("AgentText package not installed. Run: pip3 install -e /path/to/agenttext_package")
 
     try:
         # Initialize AgentText client
-        client = AgentText(base_url=args.base_url, timeout=30)
-
-        if args.action == 'start':
-            webhook = {'url': args.webhook_url} if args.webhook_url else None
-            result = client.watcher.start(webhook=webhook)
-            print(json.dumps({
-                "success": True,
-                "action": "start",
-                "message": "Watcher started",
-                "result": result if isinstance(result, dict) else str(result)
-            }))
-
-        elif args.action == 'stop':
-            result = client.watcher.stop()
-            print(json.dumps({
-                "success": True,
-                "action": "stop",
-                "message": "Watcher stopped",
-                "result": result if isinstance(result, dict) else str(result)
-            }))
-
-        elif args.action == 'status':
-            result = client.watcher.status()
-            print(json.dumps({
-                "success": True,
-                "action": "status",
-                "status": result if isinstance(result, dict) else str(result)
-            }, indent=2))
+        client = make_client(args.base_url)
+
+        print(json.dumps(run(client, args), indent=indent))
 
     except AgentTextConnectionException as e:
-        print(json.dumps({
-            "success": False,
-            "error": f"Connection error: {str(e)}. Make sure the API server is running on {args.base_url}"
-        }))
-        sys.exit(1)
+        fail(f"Connection error: {str(e)}. Make sure the API server is running on {args.base_url}")
     except AgentTextAPIException as e:
-        print(json.dumps({
-            "success": False,
-            "error": f"API error: {str(e)}"
-        }))
-        sys.exit(1)
+        fail(f"API error: {str(e)}")
     except Exception as e:
-        print(json.dumps({
-            "success": False,
-            "error": str(e)
-        }))
-        sys.exit(1)
+        fail(str(e))
 
 
 if __name__ == "__main__":